@@ -2,20 +2,53 @@ import csv
 import json
 import logging
 import sys
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 
-import matplotlib.pyplot as plt
+import numpy as np
 import os
+import orjson
 import re
 import requests
-import statistics
 from collections import Counter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.backends import default_backend
+
+try:
+    import re2  # Optional: google-re2 matches in linear time without backtracking
+except ImportError:
+    re2 = None
+
+MAX_WORKERS = 8  # Upper bound on concurrent HTTP requests
+LOW_SCORE_BATCH_SIZE = 100  # Low score records sent per POST request
 
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def report_figure():
+    """
+    Creates the figure used for report graphs on first use and returns the same one afterwards.
+
+    matplotlib is imported here rather than at module load so runs that never draw a graph
+    (such as --decrypt) skip its import cost. The figure is built directly from
+    matplotlib.figure instead of pyplot, so no interactive backend is initialised and
+    saving goes through the non-interactive Agg renderer.
+
+    :return: The cached figure and its single set of axes.
+    :rtype: tuple[matplotlib.figure.Figure, matplotlib.axes.Axes]
+    """
+    from matplotlib.figure import Figure
+
+    figure = Figure(figsize=(10, 6))
+    return figure, figure.add_subplot()
 
 
 # Define a main() function that prints a little greeting.
@@ -27,73 +60,75 @@ def main():
     if len(sys.argv) >= 2 and sys.argv[1] == "--decrypt":
         email = input("Enter id to decrypt: ")
         encryption_key = input("Enter encryption key: ")
-        processor = StudentDataProcessor(
+        with StudentDataProcessor(
             encryption_key=encryption_key,
             source_url="https://api.slingacademy.com/v1/sample-data/files/student-scores.json",
-        )
-        decrypted_email = processor.decrypt_field(id=1)
+        ) as processor:
+            decrypted_email = processor.decrypt_field(id=1)
         print(f"Decrypted email: {decrypted_email}")
         return
 
     # Initialize StudentDataProcessor to handle the processing pipeline
-    processor = StudentDataProcessor(
+    with StudentDataProcessor(
         source_url="https://api.slingacademy.com/v1/sample-data/files/student-scores.json"
-    )
-    valid_student_data = processor.fetch_and_process_student_data(file_format="json")
+    ) as processor:
+        valid_student_data = processor.fetch_and_process_student_data(
+            file_format="json"
+        )
 
-    if not valid_student_data:
-        logging.error("No valid student data found.")
-        return
+        if not valid_student_data:
+            logger.error("No valid student data found.")
+            return
+
+        # Save processed student data to JSON and CSV formats
+        processor.save_student_data(
+            valid_student_data, filename="student_data.json", file_format="json"
+        )
+        processor.save_student_data(
+            valid_student_data, filename="student_data.csv", file_format="csv"
+        )
 
-    # Save processed student data to JSON and CSV formats
-    processor.save_student_data(
-        valid_student_data, filename="student_data.json", file_format="json"
-    )
-    processor.save_student_data(
-        valid_student_data, filename="student_data.csv", file_format="csv"
-    )
-
-    # Calculate and save summary metrics for student data
-    summary_metrics = processor.calculate_summary_metrics(valid_student_data)
-    processor.save_student_data(
-        summary_metrics, filename="summary_metrics.json", file_format="json"
-    )
-
-    # Save subject metrics as a CSV file
-    headers = ["Subject"] + list(
-        next(iter(summary_metrics["subject_metrics"].values())).keys()
-    )
-    processor.save_csv(
-        summary_metrics["subject_metrics"],
-        headers=headers,
-        filename="subject_metrics.csv",
-        headerOverride="Subject",
-    )
-
-    # Save CSV files for gender, career aspiration, and extracurricular activity comparisons
-    processor.save_csv(
-        [summary_metrics["comparisons"]["by_gender"]], filename="gender_metrics.csv"
-    )
-
-    processor.save_csv(
-        [summary_metrics["comparisons"]["by_career_aspiration"]],
-        filename="career_metrics.csv",
-    )
-
-    processor.save_csv(
-        [summary_metrics["comparisons"]["by_extracurricular_activities"]],
-        filename="extracurricular_metrics.csv",
-    )
-
-    # Generate a PNG graph of subject metrics
-    processor.generate_report(
-        summary_metrics["subject_metrics"], filename="subject_metrics.png"
-    )
-
-    # Post low-score records to an external API
-    processor.post_low_scores()
-
-    logging.info(f"Summary metrics: {summary_metrics}")
+        # Calculate and save summary metrics for student data
+        summary_metrics = processor.calculate_summary_metrics(valid_student_data)
+        processor.save_student_data(
+            summary_metrics, filename="summary_metrics.json", file_format="json"
+        )
+
+        # Save subject metrics as a CSV file
+        headers = ["Subject"] + list(
+            next(iter(summary_metrics["subject_metrics"].values())).keys()
+        )
+        processor.save_csv(
+            summary_metrics["subject_metrics"],
+            headers=headers,
+            filename="subject_metrics.csv",
+            headerOverride="Subject",
+        )
+
+        # Save CSV files for gender, career aspiration, and extracurricular activity comparisons
+        processor.save_csv(
+            [summary_metrics["comparisons"]["by_gender"]], filename="gender_metrics.csv"
+        )
+
+        processor.save_csv(
+            [summary_metrics["comparisons"]["by_career_aspiration"]],
+            filename="career_metrics.csv",
+        )
+
+        processor.save_csv(
+            [summary_metrics["comparisons"]["by_extracurricular_activities"]],
+            filename="extracurricular_metrics.csv",
+        )
+
+        # Generate a PNG graph of subject metrics
+        processor.generate_report(
+            summary_metrics["subject_metrics"], filename="subject_metrics.png"
+        )
+
+        # Post low-score records to an external API
+        processor.post_low_scores()
+
+        logger.info("Summary metrics: %s", summary_metrics)
 
 
 class StudentDataProcessor:
@@ -101,14 +136,28 @@ class StudentDataProcessor:
     Processes student data from an API, performs encryption, decryption, and data transformations.
     """
 
-    REQUIRED_FIELDS = [
+    REQUIRED_FIELDS = (
         "id",
         "first_name",
         "last_name",
         "email",
-    ]  # Required fields for student records
+    )  # Required fields for student records
+    REQUIRED_GETTER = itemgetter(
+        *REQUIRED_FIELDS
+    )  # Fetches every required field in one call
     EMAIL_REGEX = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"  # Regular expression for email validation
-    low_score_requests = []  # Stores low-score requests to be posted to an external API
+    EMAIL_RE = (
+        re2.compile(EMAIL_REGEX) if re2 else re.compile(EMAIL_REGEX, re.ASCII)
+    )  # Compiled once, reused for every record
+    SCORE_FIELDS = (
+        "math_score",
+        "history_score",
+        "physics_score",
+        "chemistry_score",
+        "biology_score",
+        "english_score",
+        "geography_score",
+    )  # Subject score fields, in report order
 
     def __init__(self, source_url=None, encryption_key=None):
         """
@@ -120,6 +169,12 @@ class StudentDataProcessor:
         :type encryption_key: Optional[str]
         """
         self.source_url = source_url
+        # Low-score requests to be posted to an external API, per processor instance
+        self.low_score_requests = []
+        # Parsed student files as {path: ((mtime, size), records)}, and the email index built from them
+        self._file_cache = {}
+        self._email_index = {}
+        self._email_index_source = None
 
         if not encryption_key:
             self.encryption_key = os.urandom(32)
@@ -131,14 +186,71 @@ class StudentDataProcessor:
                 f"Encryption key not provided. Using random key: {self.encryption_key.hex()}"
             )
 
+        # Shared HTTP session so the fetch and post calls reuse pooled keep-alive connections
+        self.session = requests.Session()
+        self.session.headers.update({"Accept": "application/json"})
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=MAX_WORKERS,
+                pool_maxsize=MAX_WORKERS,
+                max_retries=Retry(total=3, backoff_factor=0.2),
+            ),
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Closes the HTTP session and releases any pooled connections.
+
+        :return: None
+        """
+        self.session.close()
+
+    @property
+    def encryption_key(self):
+        """
+        The raw AES key used to encrypt and decrypt email fields.
+
+        :rtype: bytes
+        """
+        return self._encryption_key
+
+    @encryption_key.setter
+    def encryption_key(self, key):
+        self._encryption_key = key
+        self._aes = None  # Built from the new key by _cipher on first use
+
+    def _cipher(self, mode):
+        """
+        Returns an AES cipher for the current encryption key in the given mode.
+
+        The AES algorithm object is built once per key and shared by every encrypt/decrypt
+        call. It is built lazily so an invalid key fails inside `encrypt_field` or
+        `decrypt_field`, where the error is logged, rather than in the constructor.
+
+        :param mode: The block cipher mode, e.g. `modes.CFB(iv)`.
+        :type mode: cryptography.hazmat.primitives.ciphers.modes.Mode
+        :return: The cipher for the current key.
+        :rtype: cryptography.hazmat.primitives.ciphers.Cipher
+        """
+        if self._aes is None:
+            self._aes = algorithms.AES(self._encryption_key)
+        return Cipher(self._aes, mode)
+
     def fetch_and_process_student_data(self, file_format="json"):
         """
         Fetches and processes student data based on the provided file format.
 
         This function attempts to load student data from local JSON or CSV files if they
         exist. If the specified format file is not available, it will fetch the data
-        from an external source, parse it, handle missing, null, or malformed entries,
-        and then process the cleaned data.
+        from an external source, parse it, and process it; null values are removed during
+        processing rather than in a separate cleaning pass.
 
         :param file_format: Specifies the format in which student data should be fetched.
             Acceptable values are "json" or "csv".
@@ -148,25 +260,22 @@ class StudentDataProcessor:
             an empty list is returned.
         :rtype: list
         """
-        logging.debug("fetch_and_process_student_data >>")
+        logger.debug("fetch_and_process_student_data >>")
         try:
             if file_format.lower() == "json" and os.path.exists("student_data.json"):
-                with open("student_data.json", "r") as file:
-                    return json.load(file)
+                return self.load_student_file("student_data.json")
             elif file_format.lower() == "csv" and os.path.exists("student_data.csv"):
-                with open("student_data.csv", "r") as file:
-                    reader = csv.DictReader(file)
-                    return [row for row in reader]
+                return self.load_student_file("student_data.csv")
             else:
                 raw_data = self.fetch_json_data()
                 student_data = self.parse_student_data(raw_data)
-                cleaned_data = self.handle_missing_null_malformed_data(student_data)
-                return self.process_student_data(cleaned_data)
+                # process_student_data drops null values itself, in its single pass
+                return self.process_student_data(student_data)
         except Exception as e:
-            logging.error(f"Error fetching student data: {e}")
+            logger.error("Error fetching student data: %s", e)
             return []
         finally:
-            logging.debug("fetch_and_process_student_data <<")
+            logger.debug("fetch_and_process_student_data <<")
 
     def fetch_json_data(self):
         """
@@ -179,34 +288,35 @@ class StudentDataProcessor:
 
         :raises requests.exceptions.RequestException: If any network-related error or issue occurs
             during the HTTP request.
-        :raises json.JSONDecodeError: If the JSON response data is malformed or cannot be parsed.
+        :raises json.JSONDecodeError: If the JSON response data is malformed or cannot be parsed
+            (``orjson.JSONDecodeError`` is a subclass).
         :return: Parsed JSON data as a Python dictionary or list. If an error occurs or the JSON is
             malformed, an empty list is returned.
         :rtype: Union[dict, list]
         """
-        logging.debug("fetch_json_data >>")
+        logger.debug("fetch_json_data >>")
         try:
-            logging.info("Fetching JSON data from %s...", self.source_url)
-            response = requests.get(self.source_url, timeout=10)
+            logger.info("Fetching JSON data from %s...", self.source_url)
+            response = self.session.get(self.source_url, timeout=10)
             response.raise_for_status()
-            logging.info("Data fetched successfully.")
-            data = response.text
+            logger.info("Data fetched successfully.")
 
             try:
-                parsed_data = json.loads(data)
-                logging.info("JSON data validated successfully.")
+                # Parse the raw body bytes directly; skips charset detection and the str copy
+                parsed_data = orjson.loads(response.content)
+                logger.info("JSON data validated successfully.")
                 return parsed_data
             except json.JSONDecodeError as e:
-                logging.error(f"Malformed JSON data: {e}")
+                logger.error("Malformed JSON data: %s", e)
                 return []
         except requests.exceptions.RequestException as e:
-            logging.error("Error fetching JSON data: %s", str(e))
+            logger.error("Error fetching JSON data: %s", str(e))
             return []
         except json.JSONDecodeError as e:
-            logging.error("Error decoding JSON data: %s", str(e))
+            logger.error("Error decoding JSON data: %s", str(e))
             return []
         finally:
-            logging.debug("fetch_json_data <<")
+            logger.debug("fetch_json_data <<")
 
     def parse_student_data(self, raw_data):
         """
@@ -221,19 +331,19 @@ class StudentDataProcessor:
         :return: The parsed student data if input type is correct, otherwise an empty list.
         :rtype: list
         """
-        logging.debug("parse_student_data >>")
+        logger.debug("parse_student_data >>")
         try:
-            logging.info("Parsing student data...")
+            logger.info("Parsing student data...")
             if isinstance(raw_data, list):
-                logging.info("JSON data is a list.")
+                logger.info("JSON data is a list.")
                 return raw_data
             else:
-                logging.info("Expected a list of student data, but got something else.")
+                logger.info("Expected a list of student data, but got something else.")
                 return []
         except Exception as e:
-            logging.error("Unexpected error parsing student data: %s", str(e))
+            logger.error("Unexpected error parsing student data: %s", str(e))
         finally:
-            logging.debug("parse_student_data <<")
+            logger.debug("parse_student_data <<")
 
     def handle_missing_null_malformed_data(self, student_data):
         """
@@ -249,7 +359,7 @@ class StudentDataProcessor:
             is guaranteed to contain only non-null values.
         :rtype: list[dict]
         """
-        logging.debug("handle_missing_null_malformed_data >>")
+        logger.debug("handle_missing_null_malformed_data >>")
         cleaned_students = []
         for student in student_data:
             try:
@@ -257,20 +367,23 @@ class StudentDataProcessor:
                 cleaned_student = {k: v for k, v in student.items() if v is not None}
                 cleaned_students.append(cleaned_student)
             except Exception as e:
-                logging.error("Error cleaning student data: %s", str(e))
-        logging.info("Total cleaned student records: %d", len(cleaned_students))
-        logging.debug("handle_missing_null_malformed_data <<")
+                logger.error("Error cleaning student data: %s", str(e))
+        logger.info("Total cleaned student records: %d", len(cleaned_students))
+        logger.debug("handle_missing_null_malformed_data <<")
         return cleaned_students
 
     def process_student_data(self, student_data):
         """
         Processes a list of student data records and filters valid student entries.
 
-        The function validates each student record from the input data, ensuring it meets
-        proper validation rules. It maintains a unique set of processed student records
-        to avoid duplicates, encrypts certain sensitive fields (e.g., "email"), and performs
-        additional checks such as monitoring for low scores. Invalid records are excluded
-        from the output result.
+        Null values are dropped from each record first, as `handle_missing_null_malformed_data`
+        does, so raw parsed data can be passed in directly and is only walked once; every record
+        is copied, so the input dictionaries are never modified. The function then validates
+        each student record, ensuring it meets proper validation rules. It maintains a unique set of processed
+        student records, keyed by student id, to avoid duplicates, encrypts certain sensitive
+        fields (e.g., "email"), and performs additional checks such as monitoring for low
+        scores. Invalid records are excluded from the output result. Encryption runs once per
+        unique student after de-duplication, so merged duplicates never carry a plaintext email.
 
         :param student_data: A list of dictionaries, where each dictionary contains the
             data for an individual student. Expected dictionary keys include 'first_name',
@@ -279,39 +392,46 @@ class StudentDataProcessor:
             after processing, de-duplication, and field modifications.
         :rtype: list[dict]
         """
-        logging.debug("process_student_data >>")
-        valid_students = {}
-        seen_students = set()  # Tracks seen students to prevent duplicates
+        logger.debug("process_student_data >>")
+        valid_students = {}  # Keyed by student id; doubles as the seen set
 
         for student in student_data:
+            try:
+                # Remove null values in the same pass that validates and de-duplicates
+                student = {k: v for k, v in student.items() if v is not None}
+            except Exception as e:
+                logger.error("Error cleaning student data: %s", str(e))
+                continue
+
             if self.validate_student_record(student):
-                # Create a unique identifier (can be customized to fit needs)
-                student_identifier = (
-                    student.get("first_name"),
-                    student.get("last_name"),
-                    student.get("email"),
-                )
+                # The id is the dataset's primary key (decrypt_field looks records up by it)
+                student_identifier = student["id"]
 
-                if student_identifier in seen_students:
-                    logging.warning(
-                        f"Duplicate student record found, updating: {student}"
+                if student_identifier in valid_students:
+                    logger.warning(
+                        "Duplicate student record found, updating: %s", student
                     )
                     valid_students[student_identifier].update(student)
                     continue  # Skip this duplicate record
 
-                seen_students.add(student_identifier)  # Mark this student as seen
-
-                if student["email"]:
-                    student["email"] = self.encrypt_field(student["email"])
-                self.check_for_low_scores(student)
                 valid_students[student_identifier] = student
             else:
-                logging.warning(
+                logger.warning(
                     "Student record is invalid and will be excluded: %s", student
                 )
-        logging.info("Total valid student records: %d", len(valid_students))
-        logging.debug("process_student_data <<")
-        return list(valid_students.values())
+
+        # Encrypt once per unique student after de-duplication, drawing all IVs in one call
+        students = list(valid_students.values())
+        ivs = os.urandom(16 * len(students))
+        for index, student in enumerate(students):
+            student["email"] = self.encrypt_field(
+                student["email"], iv=ivs[index * 16 : (index + 1) * 16]
+            )
+            self.check_for_low_scores(student)
+
+        logger.info("Total valid student records: %d", len(students))
+        logger.debug("process_student_data <<")
+        return students
 
     def validate_student_record(self, student_record):
         """
@@ -326,25 +446,30 @@ class StudentDataProcessor:
         :return: Returns True if the student record is valid; otherwise, False.
         :rtype: bool
         """
-        missing_fields = [
-            field
-            for field in self.REQUIRED_FIELDS
-            if field not in student_record or not student_record[field]
-        ]
-        if missing_fields:
-            logging.error(
+        # Common case first: every required field is present and non-empty
+        try:
+            valid = all(self.REQUIRED_GETTER(student_record))
+        except (KeyError, TypeError):
+            valid = False  # A missing field, or a record that is not a mapping
+        if not valid:
+            missing_fields = [
+                field
+                for field in self.REQUIRED_FIELDS
+                if field not in student_record or not student_record[field]
+            ]
+            logger.error(
                 "Student record is missing required fields: %s for student records: %s",
                 missing_fields,
                 student_record,
             )
             return False
-        if not re.match(self.EMAIL_REGEX, student_record.get("email", "")):
-            logging.error(
+        if not self.EMAIL_RE.match(student_record["email"]):
+            logger.error(
                 "Invalid email format for student: %s", student_record["email"]
             )
         return True
 
-    def encrypt_field(self, field):
+    def encrypt_field(self, field, iv=None):
         """
         Encrypt a provided field using AES encryption in CFB mode.
 
@@ -356,37 +481,38 @@ class StudentDataProcessor:
 
         :param field: The plaintext string to be encrypted.
         :type field: str
+        :param iv: Optional 16-byte random IV, for callers that draw IVs for many fields
+            at once. It must never be reused with the same key. A fresh IV is generated
+            when omitted.
+        :type iv: Optional[bytes]
         :return: Returns the IV concatenated with the encrypted field as a hex string.
                  If the input is invalid or an error occurs, returns None.
         :rtype: str or None
         """
-        logging.debug("encrypt_field >>")
+        logger.debug("encrypt_field >>")
         try:
             if not field:
                 return None
 
-            iv = os.urandom(16)
-            cipher = Cipher(
-                algorithms.AES(self.encryption_key),
-                modes.CFB(iv),
-                backend=default_backend(),
-            )
-            encryptor = cipher.encryptor()
+            if iv is None:
+                iv = os.urandom(16)
+            encryptor = self._cipher(modes.CFB(iv)).encryptor()
             encrypted_field = (
                 encryptor.update(field.encode("utf-8")) + encryptor.finalize()
             )
-            return iv.hex() + encrypted_field.hex()
+            return (iv + encrypted_field).hex()
         except Exception as e:
-            logging.error(f"Error encrypting email: {e}")
+            logger.error("Error encrypting email: %s", e)
             return None
         finally:
-            logging.debug("encrypt_field <<")
+            logger.debug("encrypt_field <<")
 
     def decrypt_field(self, id=None):
         """
         Decrypts the email field for a specific student record based on the provided ID. This
-        function fetches student data from either a JSON or CSV file, locates the record with
-        the given ID, and decrypts the email field using the AES encryption algorithm.
+        function looks the ID up in the index of encrypted emails built from either the JSON
+        or CSV file (see `load_email_index`), and decrypts the email field using the AES
+        encryption algorithm.
 
         :param id: The unique identifier of the student record to be decrypted.
         :type id: Optional[str]
@@ -394,45 +520,111 @@ class StudentDataProcessor:
             found or decryption fails.
         :rtype: Optional[str]
         """
-        logging.debug("decrypt_field >>")
+        logger.debug("decrypt_field >>")
 
         try:
-            student_data = []
-            if os.path.exists("student_data.json"):
-                with open("student_data.json", "r") as file:
-                    student_data = json.load(file)
-            elif os.path.exists("student_data.csv"):
-                with open("student_data.csv", "r") as file:
-                    reader = csv.DictReader(file)
-                    student_data = [row for row in reader]
-
-            student_record = next((x for x in student_data if x["id"] == id), None)
-            if student_record is None:
-                logging.error("Student record not found.")
+            encrypted_email = self.load_email_index().get(id)
+            if encrypted_email is None:
+                logger.error("Student record not found.")
                 return None
 
-            iv = bytes.fromhex(student_record["email"][:32])
-            encrypted_bytes = bytes.fromhex(student_record["email"][32:])
-            cipher = Cipher(
-                algorithms.AES(self.encryption_key),
-                modes.CFB(iv),
-                backend=default_backend(),
-            )
-            decryptor = cipher.decryptor()
+            iv = bytes.fromhex(encrypted_email[:32])
+            encrypted_bytes = bytes.fromhex(encrypted_email[32:])
+            decryptor = self._cipher(modes.CFB(iv)).decryptor()
             decrypted_email = decryptor.update(encrypted_bytes) + decryptor.finalize()
-            logging.debug("decrypt_field <<")
+            logger.debug("decrypt_field <<")
             return decrypted_email.decode("utf-8")
         except Exception as e:
-            logging.error(f"Error decrypting email: {e}")
+            logger.error("Error decrypting email: %s", e)
             return None
 
+    def load_student_file(self, path):
+        """
+        Loads saved student records from a JSON or CSV file.
+
+        The parsed records are kept on the processor keyed by path, together with the file's
+        modification time and size, so later calls for an unchanged file skip reading and parsing it
+        again; a changed file is reloaded. Each call returns its own copies of the records, so
+        callers may modify them without affecting the cached data.
+
+        :param path: Path of the file to load. Files ending in ".json" are parsed as JSON, any
+            other file as CSV with a header row.
+        :type path: str
+        :return: The student records stored in the file.
+        :rtype: list[dict]
+        """
+        return [dict(record) for record in self._read_student_file(path)]
+
+    def _read_student_file(self, path):
+        """
+        Returns the cached records parsed from a JSON or CSV file, loading it if needed.
+
+        The cache is keyed on the file's modification time and size, and later calls for an
+        unchanged file return the same list object. Files that cannot be stat'ed are parsed on
+        every call. The returned list is shared with the cache
+        and must not be modified; use `load_student_file` for records that can be.
+
+        :param path: Path of the file to load.
+        :type path: str
+        :return: The student records stored in the file.
+        :rtype: list[dict]
+        """
+        try:
+            stat = os.stat(path)
+            # The size catches rewrites that land within the same mtime tick
+            version = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            version = None  # File state unknown, so the parsed file cannot be reused
+
+        cached = self._file_cache.get(path)
+        if version is not None and cached is not None and cached[0] == version:
+            return cached[1]
+
+        if path.endswith(".json"):
+            with open(path, "rb") as file:
+                student_data = orjson.loads(file.read())
+        else:
+            with open(path, "r") as file:
+                student_data = list(csv.DictReader(file))
+
+        if version is not None:
+            self._file_cache[path] = (version, student_data)
+        return student_data
+
+    def load_email_index(self):
+        """
+        Returns a mapping of student ID to encrypted email, built from the saved student data.
+
+        The index is read from "student_data.json", or from "student_data.csv" if the JSON file
+        does not exist, through the file cache behind `load_student_file`. It is rebuilt only
+        when the file is reloaded, so repeated lookups (e.g. decrypting many IDs) reuse it instead of
+        scanning the whole file, until the file changes. When several records share an ID, the
+        first one in the file wins.
+
+        :return: The encrypted email for each student ID, or an empty dict if neither file exists.
+        :rtype: dict
+        """
+        if os.path.exists("student_data.json"):
+            student_data = self._read_student_file("student_data.json")
+        elif os.path.exists("student_data.csv"):
+            student_data = self._read_student_file("student_data.csv")
+        else:
+            return {}
+
+        if student_data is not self._email_index_source:
+            self._email_index = {
+                record["id"]: record["email"] for record in reversed(student_data)
+            }
+            self._email_index_source = student_data
+        return self._email_index
+
     def check_for_low_scores(self, student_record):
         """
         Checks for any low scores in the student's record and, if found, prepares a payload
         with the student's information and low scores for a POST request.
 
         A score is considered "low" if:
-        - The key for the score ends with "_score".
+        - The key for the score is one of the subjects in SCORE_FIELDS.
         - The score is an integer or float type.
         - The score is less than 65.
 
@@ -441,7 +633,7 @@ class StudentDataProcessor:
 
         :param student_record: A dictionary containing details about a student, including their
             scores across subjects. Must include a valid "id", "first_name", "last_name", and
-            "email" as keys, along with keys for subjects ending in "_score".
+            "email" as keys, along with the subject score keys listed in SCORE_FIELDS.
         :type student_record: dict
 
         :raises requests.exceptions.RequestException: If an error occurs when attempting to post
@@ -449,18 +641,17 @@ class StudentDataProcessor:
 
         :return: None
         """
-        logging.debug("post_low_scores >>")
+        logger.debug("post_low_scores >>")
         try:
             low_score_subjects = {
                 subject: score
-                for subject, score in student_record.items()
-                if subject.endswith("_score")
-                and isinstance(score, (int, float))
+                for subject in self.SCORE_FIELDS
+                if isinstance(score := student_record.get(subject), (int, float))
                 and score < 65
             }
 
             if low_score_subjects:
-                logging.debug(f"Low score subjects found for student: {student_record}")
+                logger.debug("Low score subjects found for student: %s", student_record)
                 url = "https://httpbin.org/post"
                 payload = {
                     "id": student_record["id"],
@@ -471,39 +662,60 @@ class StudentDataProcessor:
                 }
                 self.low_score_requests.append(payload)
         except requests.exceptions.RequestException as e:
-            logging.error(
-                f"Error posting low score for student {student_record['id']}: {e}"
+            logger.error(
+                "Error posting low score for student %s: %s", student_record["id"], e
             )
         finally:
-            logging.debug("post_low_scores <<")
+            logger.debug("post_low_scores <<")
 
     def post_low_scores(self):
         """
         Post low score records to an external API.
 
-        This method attempts to send the accumulated low score records to an external
-        API endpoint using a POST request. If successful, the records are transmitted
-        and a successful response is logged. In the event of a failure during the HTTP
-        request, an error message is logged.
+        This method sends the accumulated low score records to an external API endpoint
+        in batches of LOW_SCORE_BATCH_SIZE records. The batches are posted concurrently
+        on a pool of up to MAX_WORKERS threads sharing the processor's HTTP session, so
+        the network round trips overlap instead of running one after another. Each batch
+        is handled by `post_low_score_batch`, which logs its own failures.
+
+        :return: None
+        """
+        logger.debug("post_low_scores >>")
+        if self.low_score_requests:
+            logger.info("Posting low score records: %s", self.low_score_requests)
+            batches = [
+                self.low_score_requests[start : start + LOW_SCORE_BATCH_SIZE]
+                for start in range(
+                    0, len(self.low_score_requests), LOW_SCORE_BATCH_SIZE
+                )
+            ]
+            with ThreadPoolExecutor(
+                max_workers=min(MAX_WORKERS, len(batches))
+            ) as executor:
+                list(executor.map(self.post_low_score_batch, batches))
+        logger.debug("post_low_scores <<")
+
+    def post_low_score_batch(self, batch):
+        """
+        Post a single batch of low score records to the external API.
 
+        :param batch: The low score payloads to send in one POST request.
+        :type batch: list[dict]
         :raises requests.exceptions.RequestException: Raised if there is an
             issue with the HTTP request during posting (e.g., connection issues,
-            timeouts, or HTTP errors).
+            timeouts, or HTTP errors). The error is logged and not propagated.
         :return: None
         """
-        logging.debug("post_low_scores >>")
         try:
-            if self.low_score_requests:
-                logging.info(f"Posting low score records: {self.low_score_requests}")
-                response = requests.post(
-                    "https://httpbin.org/post", json=self.low_score_requests
-                )
-                response.raise_for_status()
-                logging.debug(
-                    f"Low score records posted successfully: {response.json()}"
+            response = self.session.post("https://httpbin.org/post", json=batch)
+            response.raise_for_status()
+            # Only read the echoed body when it will actually be logged
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Low score records posted successfully: %s", response.text[:512]
                 )
         except requests.exceptions.RequestException as e:
-            logging.error(f"Error posting low score records: {e}")
+            logger.error("Error posting low score records: %s", e)
 
     def save_csv(
         self,
@@ -535,24 +747,51 @@ class StudentDataProcessor:
         :type delimiter: str
         :return: None
         """
-        logging.debug("save_csv >>")
+        logger.debug("save_csv >>")
         with open(filename, mode="w", newline="") as file:
             if headers is None:
                 headers = student_data[0].keys()
+            headers = list(headers)
+
+            # Pull each row's values in one C-level itemgetter call instead of DictWriter's
+            # per-field lookups; the extra-key check only runs when the row's size differs
+            # itemgetter needs at least one key; with no columns every row is empty
+            get_fields = itemgetter(*headers) if headers else lambda row: ()
+            single_column = len(headers) == 1
+
+            def check_extra_fields(row):
+                # Reject fields that have no column, as DictWriter did
+                wrong_fields = row.keys() - headers
+                if wrong_fields:
+                    raise ValueError(
+                        "dict contains fields not in fieldnames: "
+                        + ", ".join([repr(field) for field in wrong_fields])
+                    )
+
+            def row_values(row):
+                try:
+                    values = get_fields(row)
+                except KeyError:
+                    # Leave fields missing from this record blank, as DictWriter did
+                    check_extra_fields(row)
+                    return [row.get(header, "") for header in headers]
+                if len(row) != len(headers):
+                    check_extra_fields(row)
+                return (values,) if single_column else values
 
-            writer = csv.DictWriter(file, fieldnames=headers, delimiter=delimiter)
+            writer = csv.writer(file, delimiter=delimiter)
 
-            writer.writeheader()
+            writer.writerow(headers)
 
             if headerOverride is None:
-                writer.writerows(student_data)
+                writer.writerows(map(row_values, student_data))
             else:
                 for override, metrics in student_data.items():
                     row = {headerOverride: override}
                     row.update(metrics)
-                    writer.writerow(row)
-            logging.info(f"Student data saved to {filename} in CSV format.")
-        logging.debug("save_csv <<")
+                    writer.writerow(row_values(row))
+            logger.info("Student data saved to %s in CSV format.", filename)
+        logger.debug("save_csv <<")
 
     def save_json(self, student_data, filename=None):
         """
@@ -560,7 +799,9 @@ class StudentDataProcessor:
 
         This method takes in student data in a dictionary format and saves it to a specified
         file in JSON format. If the filename is not provided, it uses a default value. Logging
-        is used to record the progress of this operation.
+        is used to record the progress of this operation. The data is serialized with orjson,
+        which writes bytes directly; non-string keys (e.g. the booleans counted in the
+        comparison metrics) are converted to strings as the standard json module would.
 
         :param student_data: The data structure containing student details to be saved.
         :type student_data: dict
@@ -569,18 +810,49 @@ class StudentDataProcessor:
         :type filename: str, optional
         :return: None
         """
-        logging.debug("save_json >>")
-        with open(filename, "w") as file:
-            json.dump(student_data, file, indent=4)
-        logging.info(f"Processed student data saved to {filename} in JSON format.")
-        logging.debug("save_json <<")
+        logger.debug("save_json >>")
+        with open(filename, "wb") as file:
+            file.write(
+                orjson.dumps(
+                    student_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+            )
+        logger.info("Processed student data saved to %s in JSON format.", filename)
+        logger.debug("save_json <<")
+
+    def save_jsonl(self, student_data, filename=None):
+        """
+        Save student data to a JSON Lines file, one record per line.
+
+        Each record is serialized and written on its own, without indentation, so the data
+        can be any iterable of records, including a generator: the full dataset never has
+        to be materialized or held in memory while it is written, and the file can be read
+        back line by line.
+
+        :param student_data: The student records to be saved.
+        :type student_data: Iterable[dict]
+        :param filename: The name of the file where the student data should be saved.
+                         Defaults to None.
+        :type filename: str, optional
+        :return: None
+        """
+        logger.debug("save_jsonl >>")
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        with open(filename, "wb") as file:
+            file.writelines(
+                orjson.dumps(record, option=option) for record in student_data
+            )
+        logger.info(
+            "Processed student data saved to %s in JSON Lines format.", filename
+        )
+        logger.debug("save_jsonl <<")
 
     def save_student_data(
         self, student_data, filename="student_data.csv.json", file_format="json"
     ):
         """
         Saves the given student data to a file in the specified format. Supported formats
-        include 'json' and 'csv'. If the format is not supported, an error message will
+        include 'json', 'jsonl' and 'csv'. If the format is not supported, an error message will
         be logged. In case of an exception during the saving process, the exception will
         also be logged.
 
@@ -591,22 +863,24 @@ class StudentDataProcessor:
                          default value is 'student_data.csv.json'.
         :type filename: str, optional
         :param file_format: The format in which the student data should be saved. Supported
-                            formats are 'json' and 'csv'. The default value is 'json'.
+                            formats are 'json', 'jsonl' and 'csv'. The default value is 'json'.
         :type file_format: str, optional
         :return: None
         """
-        logging.debug("save_student_data >>")
+        logger.debug("save_student_data >>")
         try:
             if file_format.lower() == "json":
                 self.save_json(student_data, filename=filename)
             elif file_format.lower() == "csv":
                 self.save_csv(student_data, filename=filename)
+            elif file_format.lower() == "jsonl":
+                self.save_jsonl(student_data, filename=filename)
             else:
-                logging.error(f"Unsupported file format: {format}")
+                logger.error("Unsupported file format: %s", file_format)
         except Exception as e:
-            logging.error(f"Error saving {filename} to disk: {e}")
+            logger.error("Error saving %s to disk: %s", filename, e)
         finally:
-            logging.debug("save_student_data <<")
+            logger.debug("save_student_data <<")
 
     def calculate_summary_metrics(self, student_data, file_format="json"):
         """
@@ -632,63 +906,71 @@ class StudentDataProcessor:
             activities.
         :rtype: dict
         """
-        logging.debug("calculate_summary_metrics >>")
+        logger.debug("calculate_summary_metrics >>")
         try:
-            subject_scores = {
-                subject: []
-                for subject in [
-                    "math_score",
-                    "history_score",
-                    "physics_score",
-                    "chemistry_score",
-                    "biology_score",
-                    "english_score",
-                    "geography_score",
-                ]
-            }
+            # Gather scores column-wise into contiguous double buffers in a single pass
+            subject_scores = {subject: array("d") for subject in self.SCORE_FIELDS}
+            appenders = tuple(
+                (subject, scores.append) for subject, scores in subject_scores.items()
+            )
+
+            by_gender = Counter()
+            by_career_aspiration = Counter()
+            by_extracurricular_activities = Counter()
+            float_subjects = set()  # Subjects with any float score report float max/min
 
+            # Scores and category counts are all gathered in the same pass over the students
             for student in student_data:
-                for subject in subject_scores.keys():
-                    if subject in student and isinstance(
-                        student[subject], (int, float)
-                    ):
-                        subject_scores[subject].append(student[subject])
-
-            subject_metrics = {
-                subject: {
-                    "mean": statistics.mean(scores) if scores else 0,
-                    "median": statistics.median(scores) if scores else 0,
-                    "stdev": statistics.stdev(scores) if len(scores) > 1 else 0,
-                    "max": max(scores) if scores else 0,
-                    "min": min(scores) if scores else 0,
+                for subject, append_score in appenders:
+                    score = student.get(subject)
+                    # Exact type checks are cheaper than isinstance and also skip bools
+                    score_type = type(score)
+                    if score_type is int:
+                        append_score(score)
+                    elif score_type is float:
+                        append_score(score)
+                        float_subjects.add(subject)
+                by_gender[student.get("gender")] += 1
+                by_career_aspiration[student.get("career_aspiration")] += 1
+                by_extracurricular_activities[
+                    student.get("extracurricular_activities")
+                ] += 1
+
+            # Reduce each subject's scores in C with NumPy rather than statistics.*
+            subject_metrics = {}
+            for subject, scores in subject_scores.items():
+                if not scores:
+                    subject_metrics[subject] = dict.fromkeys(
+                        ("mean", "median", "stdev", "max", "min"), 0
+                    )
+                    continue
+
+                values = np.frombuffer(scores, dtype=np.float64)  # Zero-copy view
+                # max/min are one of the scores, so keep them ints when every score was
+                extreme = float if subject in float_subjects else int
+                subject_metrics[subject] = {
+                    "mean": float(values.mean()),
+                    "median": float(np.median(values)),
+                    "stdev": float(values.std(ddof=1)) if values.size > 1 else 0,
+                    "max": extreme(values.max()),
+                    "min": extreme(values.min()),
                 }
-                for subject, scores in subject_scores.items()
-            }
 
             comparisons = {
-                "by_gender": Counter(
-                    [student.get("gender") for student in student_data]
-                ),
-                "by_career_aspiration": Counter(
-                    [student.get("career_aspiration") for student in student_data]
-                ),
-                "by_extracurricular_activities": Counter(
-                    [
-                        student.get("extracurricular_activities")
-                        for student in student_data
-                    ]
-                ),
+                "by_gender": by_gender,
+                "by_career_aspiration": by_career_aspiration,
+                "by_extracurricular_activities": by_extracurricular_activities,
             }
 
             metrics = {"subject_metrics": subject_metrics, "comparisons": comparisons}
 
-            logging.info(f"Summary metrics calculated: {metrics}")
+            logger.info("Summary metrics calculated: %s", metrics)
             return metrics
         except Exception as e:
-            logging.error(f"Error calculating summary metrics: {e}")
+            logger.error("Error calculating summary metrics: %s", e)
             return {}
         finally:
-            logging.debug("calculate_summary_metrics <<")
+            logger.debug("calculate_summary_metrics <<")
 
     def generate_report(self, subject_metrics, filename="graph.png"):
         """
@@ -702,46 +984,32 @@ class StudentDataProcessor:
             dictionary should have a key "mean" for the mean score.
         :type subject_metrics: dict[str, dict[str, float]]
         :param filename: Optional. The filename where the graph image will
-            be saved. Defaults to "graph.png".
+            be saved. Defaults to "graph.png". The figure from `report_figure`
+            is cleared and redrawn on every call rather than recreated.
         :type filename: str
         :return: None
         """
-        logging.debug("generate_report >>")
+        logger.debug("generate_report >>")
         try:
             subjects = list(subject_metrics.keys())
             means = [metrics["mean"] for metrics in subject_metrics.values()]
 
-            plt.figure(figsize=(10, 6))
-            plt.bar(subjects, means, color="skyblue")
-            plt.xlabel("Subjects")
-            plt.ylabel("Average Score")
-            plt.title("Average Scores by Subject")
-            plt.xticks(rotation=45, ha="right")
-            plt.tight_layout()
-            plt.savefig(filename)
-            logging.info(f"Graph saved as {filename}")
+            figure, axes = report_figure()
+            axes.clear()
+            axes.bar(subjects, means, color="skyblue")
+            axes.set_xlabel("Subjects")
+            axes.set_ylabel("Average Score")
+            axes.set_title("Average Scores by Subject")
+            for label in axes.get_xticklabels():
+                label.set_rotation(45)
+                label.set_horizontalalignment("right")
+            figure.tight_layout()
+            figure.savefig(filename)
+            logger.info("Graph saved as %s", filename)
         except Exception as e:
-            logging.error(f"Error generating graph: {e}")
+            logger.error("Error generating graph: %s", e)
         finally:
-            plt.close()
-
-        def fetch_json_data(self):
-            logging.debug("fetch_json_data >>")
-            try:
-                logging.info("Fetching JSON data from %s...", self.source_url)
-                response = requests.get(self.source_url, timeout=10)
-                response.raise_for_status()
-                data = response.json()
-                logging.info("JSON data fetched successfully.")
-                return data
-            except requests.exceptions.RequestException as e:
-                logging.error("Error fetching JSON data: %s", str(e))
-                return []
-            except json.JSONDecodeError as e:
-                logging.error("Error decoding JSON data: %s", str(e))
-                return []
-            finally:
-                logging.debug("fetch_json_data <<")
+            logger.debug("generate_report <<")
 
 
 # This is the standard boilerplate that calls the main() function.
@@ -93,3 +93,38 @@ def test_process_student_data_missing_field(processor):
     incomplete_data = [{"id": 3, "first_name": "Missing", "last_name": "Email"}]
     result = processor.process_student_data(incomplete_data)
     assert result == []
+
+
+def test_process_student_data_duplicate_encrypted_once(processor, example_student_data, mocker):
+    mock_encrypt = mocker.spy(processor, "encrypt_field")
+    duplicate = dict(example_student_data[0], math_score=75)
+    result = processor.process_student_data(example_student_data + [duplicate])
+    assert len(result) == 2
+    assert mock_encrypt.call_count == 2
+    assert result[0]["math_score"] == 75
+    assert "@" not in result[0]["email"]  # Merged duplicate must not restore the plaintext
+
+
+def test_process_student_data_leaves_input_unmodified(processor, example_student_data):
+    original = [dict(student) for student in example_student_data]
+    processor.process_student_data(example_student_data)
+    assert example_student_data == original
+
+
+def test_handle_missing_null_malformed_data_drops_only_malformed(processor):
+    student_data = [
+        {"id": 1, "first_name": "Paul", "email": None},
+        "not a record",
+        {"id": 2, "first_name": "Danielle"},
+    ]
+    cleaned = processor.handle_missing_null_malformed_data(student_data)
+    assert cleaned == [{"id": 1, "first_name": "Paul"}, {"id": 2, "first_name": "Danielle"}]
+
+    # Generators are cleaned the same way
+    cleaned = processor.handle_missing_null_malformed_data(record for record in student_data)
+    assert cleaned == [{"id": 1, "first_name": "Paul"}, {"id": 2, "first_name": "Danielle"}]
+
+
+def test_validate_student_record_rejects_non_mapping(processor):
+    assert processor.validate_student_record("abc") is False
+    assert processor.validate_student_record({"id": 1, "first_name": "Paul"}) is False
@@ -35,3 +35,14 @@ def test_encrypt_field_same_field_yields_different_encryption(processor, sample_
     encrypted_value_1 = processor.encrypt_field(sample_field)
     encrypted_value_2 = processor.encrypt_field(sample_field)
     assert encrypted_value_1 != encrypted_value_2
+
+
+def test_encrypt_field_invalid_key_size(processor, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    processor.save_json([{"id": 1, "email": processor.encrypt_field("Paul@test.com")}],
+                        filename="student_data.json")
+
+    # A wrong-length key is only rejected when used, so the error is logged, not raised
+    invalid_processor = StudentDataProcessor(encryption_key="67d720da")
+    assert invalid_processor.encrypt_field("sample_data") is None
+    assert invalid_processor.decrypt_field(id=1) is None
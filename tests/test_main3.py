@@ -2,6 +2,7 @@
 
 import pytest
 import re
+import main
 from main import StudentDataProcessor
 
 
@@ -61,3 +62,38 @@ def test_decrypt_field_incorrect_key(processor, mocker):
     processor.encryption_key = bytes.fromhex("cf51483b089d65e0748682b086e7f648f2b6016f261b268a86ed8eda8028cf45")
     result = processor.decrypt_field("1")
     assert result is None
+
+
+def test_decrypt_field_reuses_index_until_file_changes(processor, tmp_path, monkeypatch, mocker):
+    monkeypatch.chdir(tmp_path)
+    data_file = tmp_path / "student_data.json"
+    data_file.write_text('[{"id": "1", "email": "%s"}]' % processor.encrypt_field("Paul@test.com"))
+    load_spy = mocker.spy(main.orjson, "loads")
+
+    assert processor.decrypt_field("1") == "Paul@test.com"
+    assert processor.decrypt_field("1") == "Paul@test.com"
+    assert load_spy.call_count == 1
+
+    data_file.write_text('[{"id": "1", "email": "%s"}]' % processor.encrypt_field("Danielle@test.com"))
+    assert processor.decrypt_field("1") == "Danielle@test.com"
+    assert load_spy.call_count == 2
+
+
+def test_fetch_and_process_student_data_reuses_loaded_file(processor, tmp_path, monkeypatch, mocker):
+    monkeypatch.chdir(tmp_path)
+    processor.save_json([{"id": 1, "first_name": "Paul"}], filename="student_data.json")
+    mock_fetch = mocker.patch.object(processor, "fetch_json_data")
+
+    first = processor.fetch_and_process_student_data(file_format="json")
+    second = processor.fetch_and_process_student_data(file_format="json")
+
+    assert first == [{"id": 1, "first_name": "Paul"}]
+    assert second == first
+    mock_fetch.assert_not_called()
+
+    # Each call gets its own records, so changing one result leaves the cache intact
+    first[0]["first_name"] = "Changed"
+    first.append({"id": 2})
+    assert processor.fetch_and_process_student_data(file_format="json") == [
+        {"id": 1, "first_name": "Paul"}
+    ]
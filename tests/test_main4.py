@@ -73,3 +73,14 @@ def test_calculate_summary_metrics_realistic_sample_data(processor):
     assert result["comparisons"]["by_career_aspiration"]["Lawyer"] == 1
     assert result["comparisons"]["by_career_aspiration"]["Doctor"] == 1
     assert result["comparisons"]["by_extracurricular_activities"][False] == 2
+
+
+def test_calculate_summary_metrics_keeps_integer_extremes(processor):
+    result = processor.calculate_summary_metrics(
+        [{"math_score": 99, "history_score": 50.5}, {"math_score": 50, "history_score": 70}]
+    )
+    math = result["subject_metrics"]["math_score"]
+    history = result["subject_metrics"]["history_score"]
+    assert (math["max"], math["min"]) == (99, 50)
+    assert type(math["max"]) is int and type(math["min"]) is int
+    assert type(history["max"]) is float
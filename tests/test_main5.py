@@ -0,0 +1,56 @@
+﻿# File: tests/test_main5.py
+
+import pytest
+from main import LOW_SCORE_BATCH_SIZE, StudentDataProcessor
+
+
+@pytest.fixture
+def processor():
+    return StudentDataProcessor(
+        encryption_key="67d720da118b5a8558a9eeff8fb3b11dc689aebf6fa281c95a1fc16996e6cb75",
+        source_url="https://api.slingacademy.com/v1/sample-data/files/student-scores.json")
+
+
+def test_post_low_scores_batches_records(processor, mocker):
+    mock_post = mocker.patch.object(processor.session, "post")
+    processor.low_score_requests = [{"id": i} for i in range(LOW_SCORE_BATCH_SIZE * 2 + 1)]
+
+    processor.post_low_scores()
+
+    assert mock_post.call_count == 3
+    batch_sizes = sorted(len(call.kwargs["json"]) for call in mock_post.call_args_list)
+    assert batch_sizes == [1, LOW_SCORE_BATCH_SIZE, LOW_SCORE_BATCH_SIZE]
+
+
+def test_post_low_scores_nothing_to_post(processor, mocker):
+    mock_post = mocker.patch.object(processor.session, "post")
+    processor.low_score_requests = []
+
+    processor.post_low_scores()
+
+    mock_post.assert_not_called()
+
+
+def test_check_for_low_scores_collects_low_subjects(processor):
+    student = {
+        "id": 1,
+        "first_name": "Paul",
+        "last_name": "Casey",
+        "email": "encrypted",
+        "math_score": 73,
+        "biology_score": 63,
+        "english_score": 64.5,
+        "absence_days": 3,
+    }
+
+    processor.check_for_low_scores(student)
+
+    assert processor.low_score_requests == [
+        {
+            "id": 1,
+            "first_name": "Paul",
+            "last_name": "Casey",
+            "email": "encrypted",
+            "low_scores": {"biology_score": 63, "english_score": 64.5},
+        }
+    ]
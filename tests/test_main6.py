@@ -0,0 +1,88 @@
+﻿# File: tests/test_main6.py
+
+import pytest
+from main import StudentDataProcessor
+
+
+@pytest.fixture
+def processor():
+    return StudentDataProcessor(
+        encryption_key="67d720da118b5a8558a9eeff8fb3b11dc689aebf6fa281c95a1fc16996e6cb75",
+        source_url="https://api.slingacademy.com/v1/sample-data/files/student-scores.json")
+
+
+def test_save_csv_rows_with_missing_fields(processor, tmp_path):
+    filename = tmp_path / "student_data.csv"
+    student_data = [
+        {"id": 1, "first_name": "Paul", "math_score": 73},
+        {"id": 2, "first_name": "Danielle"},
+    ]
+
+    processor.save_csv(student_data, filename=filename)
+
+    assert filename.read_text().splitlines() == [
+        "id\tfirst_name\tmath_score",
+        "1\tPaul\t73",
+        "2\tDanielle\t",
+    ]
+
+
+def test_save_csv_rejects_fields_missing_from_headers(processor, tmp_path):
+    filename = tmp_path / "student_data.csv"
+    student_data = [
+        {"id": 1, "first_name": "Paul"},
+        {"id": 2, "first_name": "Danielle", "math_score": 73},
+        {"id": 3, "math_score": 58},
+    ]
+
+    with pytest.raises(ValueError, match="math_score"):
+        processor.save_csv(student_data, filename=filename)
+    with pytest.raises(ValueError, match="math_score"):
+        processor.save_csv(student_data[2:], filename=filename, headers=["id", "first_name"])
+
+
+def test_save_csv_empty_headers(processor, tmp_path):
+    filename = tmp_path / "student_data.csv"
+    processor.save_csv([{}, {}], filename=filename)
+    assert filename.read_text() == "\n\n\n"
+
+
+def test_save_csv_single_column(processor, tmp_path):
+    filename = tmp_path / "gender_metrics.csv"
+
+    processor.save_csv([{"male": 2}], filename=filename)
+
+    assert filename.read_text().splitlines() == ["male", "2"]
+
+
+def test_save_csv_header_override(processor, tmp_path):
+    filename = tmp_path / "subject_metrics.csv"
+    subject_metrics = {
+        "math_score": {"mean": 81.5, "max": 90},
+        "history_score": {"mean": 83.5, "max": 86},
+    }
+
+    processor.save_csv(
+        subject_metrics,
+        headers=["Subject", "mean", "max"],
+        filename=filename,
+        headerOverride="Subject",
+    )
+
+    assert filename.read_text().splitlines() == [
+        "Subject\tmean\tmax",
+        "math_score\t81.5\t90",
+        "history_score\t83.5\t86",
+    ]
+
+
+def test_save_student_data_jsonl(processor, tmp_path):
+    filename = tmp_path / "student_data.jsonl"
+    records = ({"id": i, "first_name": name} for i, name in enumerate(["Paul", "Danielle"], 1))
+
+    processor.save_student_data(records, filename=filename, file_format="jsonl")
+
+    assert filename.read_text().splitlines() == [
+        '{"id":1,"first_name":"Paul"}',
+        '{"id":2,"first_name":"Danielle"}',
+    ]